@@ -0,0 +1,4 @@
+from fast_modbus.poller import main
+
+if __name__ == "__main__":
+    main()
@@ -1,133 +1,108 @@
+import logging
 import serial
 import struct
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-def calculate_crc(data):
-    """
-    Calculate the CRC16 checksum for Modbus data.
-
-    Args:
-        data (bytes): The data to calculate the CRC for.
-
-    Returns:
-        int: The calculated CRC16 checksum.
-    """
-    crc = 0xFFFF
-    for byte in data:
-        crc ^= byte
-        for _ in range(8):
-            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
-    return crc
+from fast_modbus import crc
+from fast_modbus.core import (Lazy, check_crc, format_bytes, init_serial, padding_length, read_response,
+                              register_reply_length, send_frame, setup_logging)
 
-def check_crc(response):
-    """
-    Verify the CRC checksum of the received response.
+# Run as a script, so name the logger explicitly to stay under setup_logging
+log = logging.getLogger('fast_modbus.scanner')
 
-    Args:
-        response (bytes): The response data to check.
+_U16LE = struct.Struct('<H')
+_U32BE = struct.Struct('>I')
+_MODEL_REQ = struct.Struct('>BBBIBHH')
 
-    Returns:
-        bool: True if the CRC is correct, False otherwise.
-    """
-    if len(response) < 3:
-        return False
-    data, received_crc = response[:-2], struct.unpack('<H', response[-2:])[0]
-    return received_crc == calculate_crc(data)
+_print_lock = threading.Lock()
 
-def format_bytes(data):
+def report(message):
     """
-    Format bytes as a human-readable hex string.
+    Print a line of scan output without it being split by another port's thread.
 
     Args:
-        data (bytes): The data to format.
-
-    Returns:
-        str: A string representation of the bytes in hexadecimal format.
+        message (str): The line to print.
     """
-    return ' '.join(f"0x{byte:02X}" for byte in data)
+    with _print_lock:
+        print(message)
 
-def send_command(serial_port, command, debug=False):
-    """
-    Send a command to the Modbus device through the serial port.
+# Start (0x01) and continue (0x02) frames for both scan commands, CRC included
+SCAN_FRAMES = {(scan_command, step): crc.frame_command(bytes((0xFD, scan_command, step)))
+               for scan_command in (0x46, 0x60) for step in (0x01, 0x02)}
 
-    Args:
-        serial_port (serial.Serial): The initialized serial port object.
-        command (bytes): The command to send.
-        debug (bool, optional): Whether to print debug information. Defaults to False.
-    """
-    full_command = command + struct.pack('<H', calculate_crc(command))
-    if debug:
-        print(f"SND: {format_bytes(full_command)}")
-    serial_port.write(full_command)
+# Scan reply length (CRC included) by reply code
+SCAN_REPLY_LENGTHS = {0x03: 10, 0x04: 5}
 
-def init_serial(device, baudrate):
+def _scan_reply_length(header):
     """
-    Initialize the serial port.
+    Get the length of a scan reply from its 3-byte header.
 
     Args:
-        device (str): The serial device path (e.g., '/dev/ttyUSB0').
-        baudrate (int): The baudrate for the serial communication.
+        header (bytes): FD, the scan command and the reply code.
 
     Returns:
-        serial.Serial: The initialized serial port object.
+        int: The frame length, CRC included.
     """
-    return serial.Serial(port=device, baudrate=baudrate, bytesize=serial.EIGHTBITS,
-                         parity=serial.PARITY_NONE, stopbits=serial.STOPBITS_ONE, timeout=0)
+    # 0x03 carries the serial number and Modbus ID, 0x04 (scan complete) nothing
+    return SCAN_REPLY_LENGTHS.get(header[2], 3)
 
-def wait_for_response(serial_port, timeout=2):
+def new_model_request():
     """
-    Wait for a response from the Modbus device.
+    Build a reusable frame for reading registers 200-219 (the device model).
 
-    Args:
-        serial_port (serial.Serial): The initialized serial port object.
-        timeout (int, optional): The maximum wait time in seconds. Defaults to 2.
+    The serial number and the CRC are filled in by request_device_model.
 
     Returns:
-        bool: True if data is received, False otherwise.
+        bytearray: The request frame, CRC space included.
     """
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        if serial_port.in_waiting > 0:
-            return True
-        time.sleep(0.1)
-    return False
+    model_request = bytearray(_MODEL_REQ.size + _U16LE.size)
+    _MODEL_REQ.pack_into(model_request, 0, 0xFD, 0x46, 0x08, 0, 0x03, 200, 20)
+    return model_request
 
-def request_device_model(serial_port, serial_number, debug=False):
+def request_device_model(serial_port, serial_number, model_request=None, prefix=''):
     """
     Request the model of the Modbus device by reading registers 200-219.
 
     Args:
         serial_port (serial.Serial): The initialized serial port object.
         serial_number (int): The serial number of the device.
-        debug (bool, optional): Whether to print debug information. Defaults to False.
+        model_request (bytearray, optional): A frame from new_model_request to reuse.
+            A new one is built if omitted.
+        prefix (str, optional): Text put in front of each output line, e.g. the port. Defaults to ''.
 
     Returns:
         str: The device model or "Invalid CRC" if the response is corrupted.
     """
-    model_request = struct.pack('>BBBIBHH', 0xFD, 0x46, 0x08, serial_number, 0x03, 200, 20)
-    send_command(serial_port, model_request, debug)
-
-    if wait_for_response(serial_port):
-        response = serial_port.read(256)
-        if debug:
-            print(f"RCV: {format_bytes(response)}")
-        if check_crc(response) and len(response) >= 40:
-            return response[9:29].decode('ascii').strip()
-        return "Invalid CRC"
-    return "Unknown"
-
-def send_continue_scan(serial_port, scan_command, debug=False):
+    if model_request is None:
+        model_request = new_model_request()
+    # Patch the serial number and CRC in place instead of building a new frame
+    _U32BE.pack_into(model_request, 3, serial_number)
+    _U16LE.pack_into(model_request, _MODEL_REQ.size, crc.calculate_crc(memoryview(model_request)[:_MODEL_REQ.size]))
+    send_frame(serial_port, model_request, prefix)
+
+    response = read_response(serial_port, 9, register_reply_length)
+    if not response:
+        return "Unknown"
+    log.debug("%sRCV: %s", prefix, Lazy(format_bytes, response))
+    response = memoryview(response)[padding_length(response):]
+    if check_crc(response) and len(response) >= 40:
+        # Decode straight from the view instead of slicing out a copy first
+        return str(response[9:29], 'ascii', 'replace').strip()
+    return "Invalid CRC"
+
+def send_continue_scan(serial_port, scan_command, prefix=''):
     """
     Send a command to continue scanning for Modbus devices.
 
     Args:
         serial_port (serial.Serial): The initialized serial port object.
         scan_command (int): The scan command (either 0x46 or 0x60).
-        debug (bool, optional): Whether to print debug information. Defaults to False.
+        prefix (str, optional): Text put in front of the debug line, e.g. the port. Defaults to ''.
     """
-    send_command(serial_port, struct.pack('BBB', 0xFD, scan_command, 0x02), debug)
+    send_frame(serial_port, SCAN_FRAMES[(scan_command, 0x02)], prefix)
 
-def scan_devices(serial_port, scan_command, device, baudrate, debug=False):
+def scan_devices(serial_port, scan_command, device, baudrate, show_port=False):
     """
     Scan for Modbus devices on the network.
 
@@ -136,42 +111,94 @@ def scan_devices(serial_port, scan_command, device, baudrate, debug=False):
         scan_command (int): The scan command (either 0x46 or 0x60).
         device (str): The serial device path (e.g., '/dev/ttyUSB0').
         baudrate (int): The baudrate for the serial communication.
-        debug (bool, optional): Whether to print debug information. Defaults to False.
+        show_port (bool, optional): Whether to prefix each output line with the port. Defaults to False.
 
     Returns:
-        None
+        list: The found devices as dicts with port, serial_number, modbus_id and model.
     """
-    print(f"Starting scan on port {device} with baudrate {baudrate} and scan command {hex(scan_command)}...")
+    # Ports scanned in parallel interleave their output, so label every line
+    prefix = f"{device}: " if show_port else ''
+    report(f"{prefix}Starting scan on port {device} with baudrate {baudrate} and scan command {hex(scan_command)}...")
 
     devices = []
-    send_command(serial_port, struct.pack('BBB', 0xFD, scan_command, 0x01), debug)
+    send_frame(serial_port, SCAN_FRAMES[(scan_command, 0x01)], prefix)
 
-    while wait_for_response(serial_port, 2):
-        response = serial_port.read(256)
+    while True:
+        response = read_response(serial_port, 3, _scan_reply_length)
         if not response:
             break
 
-        if debug:
-            print(f"RCV: {format_bytes(response)}")
+        log.debug("%sRCV: %s", prefix, Lazy(format_bytes, response))
 
-        response = response.lstrip(b'\xFF')
+        # A view past the padding instead of a stripped copy
+        response = memoryview(response)[padding_length(response):]
+        # A frame cut short means the port timed out mid-reply
+        if len(response) < 3:
+            break
         if len(response) >= 10 and response[2] == 0x03:
-            serial_number, modbus_id = struct.unpack('>I', response[3:7])[0], response[7]
-            model = request_device_model(serial_port, serial_number, debug)
-            devices.append({"serial_number": serial_number, "modbus_id": modbus_id, "model": model})
-            send_continue_scan(serial_port, scan_command, debug)
+            serial_number, modbus_id = _U32BE.unpack_from(response, 3)[0], response[7]
+            # Keep the discovery going; models are asked for once the bus is free
+            send_continue_scan(serial_port, scan_command, prefix)
+            devices.append({"port": device, "serial_number": serial_number, "modbus_id": modbus_id})
         elif response[2] == 0x04:
-            print("Scan complete.")
+            report(f"{prefix}Scan complete.")
             break
 
-    if devices:
-        print("\nFound devices:")
+    # One frame per scan, so ports scanned in parallel do not share it
+    model_request = new_model_request()
+    for found in devices:
+        found["model"] = request_device_model(serial_port, found["serial_number"], model_request, prefix)
+    return devices
+
+def scan_port(device, baudrate, scan_command, show_port=False):
+    """
+    Open a serial port, scan it for Modbus devices and close it again.
+
+    Serial and OS errors, such as a port that cannot be opened or one that
+    disappears mid-scan, are printed and end the scan of this port only, so
+    the devices found on other ports are still reported.
+
+    Args:
+        device (str): The serial device path (e.g., '/dev/ttyUSB0').
+        baudrate (int): The baudrate for the serial communication.
+        scan_command (int): The scan command (either 0x46 or 0x60).
+        show_port (bool, optional): Whether to prefix each output line with the port. Defaults to False.
+
+    Returns:
+        list: The found devices, as returned by scan_devices, or an empty list on an error.
+    """
+    try:
+        serial_port = init_serial(device, baudrate)
+        try:
+            return scan_devices(serial_port, scan_command, device, baudrate, show_port)
+        finally:
+            serial_port.close()
+    except (serial.SerialException, OSError) as error:
+        report(f"{device}: {error}")
+        return []
+
+def print_devices(devices, show_port=False):
+    """
+    Print the found devices as a table.
+
+    Args:
+        devices (list): The found devices, as returned by scan_devices.
+        show_port (bool, optional): Whether to add a column with the serial port. Defaults to False.
+    """
+    if not devices:
+        print("No devices found.")
+        return
+    print("\nFound devices:")
+    if show_port:
+        print("{:<15} {:<15} {:<10} {:<10}".format("Port", "Serial Number", "Modbus ID", "Model"))
+        print("-" * 51)
+        for device in devices:
+            print("{:<15} {:<15} {:<10} {:<10}".format(device["port"], device["serial_number"], device["modbus_id"], device["model"]))
+    else:
         print("{:<15} {:<10} {:<10}".format("Serial Number", "Modbus ID", "Model"))
         print("-" * 35)
         for device in devices:
             print("{:<15} {:<10} {:<10}".format(device["serial_number"], device["modbus_id"], device["model"]))
-    else:
-        print("No devices found.")
 
 def main():
     """
@@ -179,16 +206,35 @@ def main():
     """
     import argparse
     parser = argparse.ArgumentParser(description="Modbus Scanner Tool")
-    parser.add_argument('-d', '--device', required=True, help="TTY serial device (e.g., /dev/ttyUSB0)")
+    parser.add_argument('-d', '--device', nargs='+', required=True, help="TTY serial devices (e.g., /dev/ttyUSB0 /dev/ttyUSB1)")
     parser.add_argument('-b', '--baud', type=int, default=9600, help="Baudrate, default 9600")
     parser.add_argument('--command', choices=['0x46', '0x60'], default='0x46', help="Scan command (0x46 or 0x60)")
     parser.add_argument('--debug', action='store_true', help="Enable debug output")
+    crc_group = parser.add_mutually_exclusive_group()
+    crc_group.add_argument('--small-table', action='store_true', help="Use the 16-entry CRC table (smaller, slower)")
+    crc_group.add_argument('--numba', action='store_true', help="Compile the CRC with Numba if no native CRC library is installed")
     args = parser.parse_args()
 
+    setup_logging(args.debug)
+
+    if args.small_table:
+        crc.use_small_table()
+    elif args.numba and not crc.use_numba():
+        print("[warning] Numba is not installed, using the pure Python CRC.")
+
     scan_command = 0x46 if args.command == '0x46' else 0x60
-    serial_port = init_serial(args.device, args.baud)
-    scan_devices(serial_port, scan_command, args.device, args.baud, debug=args.debug)
-    serial_port.close()
+    show_port = len(args.device) > 1
+    # Each bus is scanned by its own thread; they spend their time waiting on the UART
+    with ThreadPoolExecutor(max_workers=len(args.device)) as executor:
+        futures = [executor.submit(scan_port, device, args.baud, scan_command, show_port) for device in args.device]
+    devices = []
+    for device, future in zip(args.device, futures):
+        # Anything scan_port did not expect still only costs this port its results
+        try:
+            devices.extend(future.result())
+        except Exception as error:
+            report(f"{device}: [error] Scan failed: {error!r}")
+    print_devices(devices, show_port)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,114 @@
+import logging
+import struct
+
+from . import crc
+from .core import (Lazy, auto_int, check_crc, format_bytes, init_serial, padding_length, read_response,
+                   register_reply_length, send_command, setup_logging)
+
+log = logging.getLogger(__name__)
+
+_READ_REQ = struct.Struct('>BBBIBHH')
+_WRITE_HDR = struct.Struct('>BBBIBHHB')
+
+def read_registers(serial_port, serial_number, command, register, count=1):
+    """
+    Read Modbus registers from the device.
+
+    Args:
+        serial_port (serial.Serial): The initialized serial port object.
+        serial_number (int): The serial number of the device.
+        command (int): The Modbus command (e.g., 0x03 for read).
+        register (int): The starting register address.
+        count (int, optional): The number of registers to read. Defaults to 1.
+
+    Returns:
+        bytes: The data read from the registers, or None if an error occurred.
+    """
+    request_command = _READ_REQ.pack(0xFD, 0x46, 0x08, serial_number, command, register, count)
+    send_command(serial_port, request_command)
+
+    # Header (9 bytes) + register data + CRC; an exception reply is cut short after its header
+    expected_length = 9 + 2 * count + 2
+    response = read_response(serial_port, 9, register_reply_length)
+    if not response:
+        return None
+    log.debug("RCV: %s", Lazy(format_bytes, response))
+    # Skip the 0xFF padding read_response keeps in front of the frame
+    response = memoryview(response)[padding_length(response):]
+    # Cheap length and header checks first, so malformed frames skip the CRC
+    if len(response) != expected_length or response[0] != 0xFD or response[1] != 0x46 or not check_crc(response):
+        print("[error] Invalid or short response.")
+        return None
+    return bytes(response[9:9 + 2 * count])
+
+def write_registers(serial_port, serial_number, command, register, values):
+    """
+    Write values to Modbus registers on the device.
+
+    Args:
+        serial_port (serial.Serial): The initialized serial port object.
+        serial_number (int): The serial number of the device.
+        command (int): The Modbus command (e.g., 0x10 for write).
+        register (int): The starting register address.
+        values (list of int): The values to write to the registers.
+
+    Returns:
+        bool: True if the write was successful, False otherwise.
+    """
+    register_count = len(values)
+    write_command = _WRITE_HDR.pack(0xFD, 0x46, 0x08, serial_number, command, register, register_count, register_count * 2)
+    write_command += struct.pack(f'>{register_count}H', *values)
+    send_command(serial_port, write_command)
+
+    # Header (8 bytes) + start register + register count + CRC, or a shorter exception reply
+    response = read_response(serial_port, 9, register_reply_length)
+    if not response:
+        return False
+    log.debug("RCV: %s", Lazy(format_bytes, response))
+    response = memoryview(response)[padding_length(response):]
+    return len(response) == 14 and response[0] == 0xFD and response[1] == 0x46 and check_crc(response)
+
+def main():
+    """
+    Main function to parse arguments and perform Modbus register operations (read/write).
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description="Fast Modbus Client Tool")
+    parser.add_argument('-d', '--device', required=True, help="TTY serial device (e.g., /dev/ttyUSB0)")
+    parser.add_argument('-b', '--baud', type=int, default=9600, help="Baudrate, default 9600")
+    parser.add_argument('-s', '--serial', type=auto_int, required=True, help="Device serial number (decimal or hex)")
+    parser.add_argument('-c', '--command', type=auto_int, required=True, help="Modbus command (decimal or hex)")
+    parser.add_argument('-r', '--register', type=auto_int, required=True, help="Register to read/write (decimal or hex)")
+    parser.add_argument('-n', '--count', type=auto_int, default=1, help="Number of registers to read (default 1)")
+    parser.add_argument('-w', '--write', nargs='*', type=auto_int, help="Values to write (if write operation, decimal or hex)")
+    parser.add_argument('--debug', action='store_true', help="Enable debug output")
+    parser.add_argument('--small-table', action='store_true', help="Use the 16-entry CRC table (smaller, slower)")
+    parser.add_argument('--decimal-output', action='store_true', help="Display register values in decimal format")
+    args = parser.parse_args()
+
+    setup_logging(args.debug)
+
+    if args.small_table:
+        crc.use_small_table()
+
+    serial_port = init_serial(args.device, args.baud)
+
+    if args.write:
+        success = write_registers(serial_port, args.serial, args.command, args.register, args.write)
+        print(f"Successfully wrote {len(args.write)} registers." if success else "Failed to write registers.")
+    else:
+        result = read_registers(serial_port, args.serial, args.command, args.register, args.count)
+        if result:
+            values = struct.unpack(f'>{len(result) // 2}H', result)
+            if args.decimal_output:
+                registers = ' '.join(map(str, values))
+            else:
+                registers = ' '.join(f"0x{value:04X}" for value in values)
+            print(f"Read {args.count} registers from device {args.serial}: {registers}")
+        else:
+            print("Failed to read registers.")
+
+    serial_port.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+import argparse
+import logging
+import struct
+
+from . import crc
+from .core import Lazy, check_crc, format_bytes, init_serial, read_frame, send_command, setup_logging
+
+log = logging.getLogger(__name__)
+
+_CONFIG_HDR = struct.Struct('>BBBB')
+_RANGE_HDR = struct.Struct('>BHB')
+
+REGISTER_TYPES = {
+    "coil": 0x01,
+    "discrete": 0x02,
+    "holding": 0x03,
+    "input": 0x04
+}
+
+def parse_config(config):
+    """
+    Parse the configuration string into register ranges.
+
+    Args:
+        config (str): The configuration string specifying ranges (e.g., 'input:60:2:1,discrete:0:8:1').
+
+    Returns:
+        list of tuple: The (register type, address, count, priority) of each range, register type in lower case.
+
+    Raises:
+        ValueError: If a range is malformed, out of range or uses an unknown register type.
+    """
+    ranges = []
+    for cfg in config.split(','):
+        fields = cfg.split(':')
+        if len(fields) != 4:
+            raise ValueError(f"Malformed range '{cfg}', expected type:address:count:priority")
+        reg_type, address, count, priority = fields
+        reg_type = reg_type.lower()
+        if reg_type not in REGISTER_TYPES:
+            raise ValueError(f"Unknown register type: {reg_type}")
+        try:
+            address, count, priority = int(address), int(count), int(priority)
+        except ValueError:
+            raise ValueError(f"Malformed range '{cfg}', address, count and priority must be integers") from None
+        if not 0 <= address <= 0xFFFF:
+            raise ValueError(f"Range '{cfg}': address must be 0-65535")
+        if not 1 <= count <= 0xFF:
+            raise ValueError(f"Range '{cfg}': count must be 1-255")
+        if not 0 <= priority <= 0xFF:
+            raise ValueError(f"Range '{cfg}': priority must be 0-255")
+        # Each range is sent in its own command, whose data length field is one byte
+        if 4 + count > 0xFF:
+            raise ValueError(f"Range '{cfg}': count must be at most 251 to fit in one command")
+        ranges.append((reg_type, address, count, priority))
+    return ranges
+
+def config_argument(config):
+    """
+    Parse the --config argument, reporting malformed ranges as usage errors.
+
+    Args:
+        config (str): The configuration string, as accepted by parse_config.
+
+    Returns:
+        list of tuple: The register ranges, as returned by parse_config.
+
+    Raises:
+        argparse.ArgumentTypeError: If parse_config rejects the string.
+    """
+    try:
+        return parse_config(config)
+    except ValueError as error:
+        # argparse replaces a ValueError message with a generic one
+        raise argparse.ArgumentTypeError(str(error)) from None
+
+def formulate_command(slave_id, ranges):
+    """
+    Create a command to configure event notifications for multiple register ranges.
+
+    Args:
+        slave_id (int): The slave ID of the Modbus device.
+        ranges (list of tuple): The register ranges, as returned by parse_config.
+
+    Returns:
+        bytearray: The generated command bytes.
+    """
+    length = 0
+    for reg_type, address, count, priority in ranges:
+        length += 4 + count
+        log.debug("[debug] Range: %s Address: %s Count: %s Priority: %s", reg_type, address, count, priority)
+
+    # Header: slave ID, command, subcommand, data length
+    command = bytearray(4 + length)
+    _CONFIG_HDR.pack_into(command, 0, slave_id, 0x46, 0x18, length)
+    offset = 4
+    for reg_type, address, count, priority in ranges:
+        # Range: register type, start address, count, then one priority byte per register
+        _RANGE_HDR.pack_into(command, offset, REGISTER_TYPES[reg_type], address, count)
+        offset += 4
+        command[offset:offset + count] = bytes((priority,)) * count
+        offset += count
+    return command
+
+def parse_response(response, slave_id):
+    """
+    Parse the response from the Modbus device.
+
+    Args:
+        response (bytes): The raw response data.
+        slave_id (int): The slave ID the response is expected from.
+
+    Returns:
+        bytes: The parsed mask data from the response, or None if invalid.
+    """
+    response = response.lstrip(b'\xFF')
+    log.debug("RAW Response (before filtering): %r", response)
+    if len(response) < 4:
+        print("[error] Response too short to be valid")
+        return None
+
+    if response[0] != slave_id or response[1] != 0x46 or response[2] != 0x18:
+        print("[error] Unexpected response header")
+        return None
+
+    length = response[3]
+    if len(response) < 4 + length + 2 or not check_crc(response[:4 + length + 2]):
+        print("[error] Invalid or short response")
+        return None
+    return response[4:4 + length]
+
+def print_settings(ranges, mask_data, slave_id):
+    """
+    Display the event settings in a human-readable format.
+
+    Args:
+        ranges (list of tuple): The register ranges, as returned by parse_config.
+        mask_data (bytes): The mask data from the device response.
+        slave_id (int): The Modbus device slave ID.
+    """
+    statuses = ("disabled", "enabled")
+    # Bit N of the little-endian mask is the status of the Nth register
+    mask = int.from_bytes(mask_data, 'little')
+    mask_bits = 8 * len(mask_data)
+    bit_offset = 0
+    print(f"Device: {slave_id}")
+    for reg_type, address, count, _ in ranges:
+        print(f"Settings for {reg_type.capitalize()} registers:")
+        for i in range(min(count, mask_bits - bit_offset)):
+            print(f"- Register {address + i} (u16): {statuses[(mask >> (bit_offset + i)) & 1]}")
+
+        bit_offset += 8 * (count // 8)
+
+def read_responses(serial_port, count):
+    """
+    Read several back-to-back configuration responses and split them into frames.
+
+    Args:
+        serial_port (serial.Serial): The serial port connection.
+        count (int): The number of responses expected.
+
+    Returns:
+        list of bytes: The responses in the order received, fewer than count on timeout.
+    """
+    responses = []
+    received = b''
+    while len(responses) < count:
+        received = received.lstrip(b'\xFF')
+        # Each response is <slave_id> 0x46 0x18 <length> <mask data> <CRC16>
+        if len(received) >= 4 and len(received) >= 4 + received[3] + 2:
+            frame_length = 4 + received[3] + 2
+            responses.append(received[:frame_length])
+            received = received[frame_length:]
+            continue
+        chunk = read_frame(serial_port)
+        if not chunk:
+            break
+        received += chunk
+    return responses
+
+def configure_events(serial_port, slave_id, ranges, pipelined=False):
+    """
+    Configure event settings for multiple register ranges on a Modbus device.
+
+    Args:
+        serial_port (serial.Serial): The serial port connection.
+        slave_id (int): The slave ID of the Modbus device.
+        ranges (list of tuple): The register ranges, as returned by parse_config.
+        pipelined (bool): If True, send the commands for all ranges at once and then
+            collect the responses, instead of waiting for each response in turn.
+            The device must be able to queue requests.
+    """
+    if pipelined:
+        commands = bytearray()
+        for cfg in ranges:
+            commands += crc.frame_command(bytes(formulate_command(slave_id, [cfg])))
+        log.debug("SND: %s", Lazy(format_bytes, commands))
+        serial_port.write(commands)
+        responses = read_responses(serial_port, len(ranges))
+    else:
+        responses = []
+        for cfg in ranges:
+            send_command(serial_port, formulate_command(slave_id, [cfg]))
+            responses.append(read_frame(serial_port))
+
+    for index, cfg in enumerate(ranges):
+        response = responses[index] if index < len(responses) else b''
+        log.debug("RAW Response: %r", response)
+
+        mask_data = parse_response(response, slave_id)
+        if mask_data:
+            print_settings([cfg], mask_data, slave_id)
+        else:
+            print("[error] No valid response received")
+
+def main():
+    """
+    Main entry point for configuring Modbus event notifications.
+
+    Parses command-line arguments, initializes the serial connection,
+    and configures the event settings based on the provided configuration string.
+    """
+    parser = argparse.ArgumentParser(description="Modbus Event Configuration Tool for multiple u16 register ranges")
+    parser.add_argument('--device', required=True, help="Serial device (e.g., /dev/ttyUSB0)")
+    parser.add_argument('--baud', type=int, default=9600, help="Baud rate, default is 9600")
+    parser.add_argument('--slave_id', type=int, required=True, help="Slave ID of the device")
+    parser.add_argument('--config', type=config_argument, required=True, help="Configuration string (e.g., 'input:60:2:1,discrete:0:8:1')")
+    parser.add_argument('--pipelined', action='store_true', help="Send all range commands at once, then read the responses")
+    parser.add_argument('--debug', action='store_true', help="Enable debug output")
+    parser.add_argument('--small-table', action='store_true', help="Use the 16-entry CRC table (smaller, slower)")
+    args = parser.parse_args()
+
+    setup_logging(args.debug)
+
+    if args.small_table:
+        crc.use_small_table()
+
+    serial_port = init_serial(args.device, args.baud, timeout=1)
+    configure_events(serial_port, args.slave_id, args.config, args.pipelined)
+    serial_port.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+import logging
+import os
+import select
+import serial
+import sys
+import time
+
+from . import crc
+
+log = logging.getLogger(__name__)
+
+class Lazy:
+    """
+    Defer a formatting call until a log record actually needs the text.
+
+    Args:
+        func (callable): The formatting function, e.g. format_bytes.
+        *args: The arguments to call it with.
+    """
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+    def __str__(self):
+        return self.func(*self.args)
+
+def setup_logging(debug=False):
+    """
+    Configure debug output for the command-line tools.
+
+    Only the fast_modbus loggers are configured; the root logger is left
+    alone, so third-party libraries such as Numba stay quiet.
+
+    Args:
+        debug (bool, optional): Whether to print debug information. Defaults to False.
+    """
+    logger = logging.getLogger('fast_modbus')
+    logger.setLevel(logging.DEBUG if debug else logging.WARNING)
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+
+def check_crc(response):
+    """
+    Verify the CRC checksum of the received response.
+
+    Args:
+        response (bytes): The response data to check.
+
+    Returns:
+        bool: True if the CRC is correct, False otherwise.
+    """
+    # Slicing a memoryview does not copy the response
+    view = memoryview(response)
+    return len(view) >= 3 and int.from_bytes(view[-2:], 'little') == crc.calculate_crc(view[:-2])
+
+def format_bytes(data):
+    """
+    Format bytes as a human-readable hex string.
+
+    Args:
+        data (bytes): The data to format.
+
+    Returns:
+        str: A string representation of the bytes in hexadecimal format.
+    """
+    if not data:
+        return ''
+    return '0x' + data.hex(' ').upper().replace(' ', ' 0x')
+
+def send_frame(serial_port, frame, prefix=''):
+    """
+    Send an already framed command to the Modbus device through the serial port.
+
+    Args:
+        serial_port (serial.Serial): The initialized serial port object.
+        frame (bytes-like): The command with its CRC appended.
+        prefix (str, optional): Text put in front of the debug line, e.g. the port. Defaults to ''.
+    """
+    log.debug("%sSND: %s", prefix, Lazy(format_bytes, frame))
+    serial_port.write(frame)
+
+def send_command(serial_port, command, prefix=''):
+    """
+    Send a command to the Modbus device through the serial port.
+
+    Args:
+        serial_port (serial.Serial): The initialized serial port object.
+        command (bytes): The command to send.
+        prefix (str, optional): Text put in front of the debug line, e.g. the port. Defaults to ''.
+    """
+    send_frame(serial_port, crc.frame_command(bytes(command)), prefix)
+
+def init_serial(device, baudrate, timeout=2):
+    """
+    Initialize the serial port.
+
+    Args:
+        device (str): The serial device path (e.g., '/dev/ttyUSB0').
+        baudrate (int): The baudrate for the serial communication.
+        timeout (float, optional): The maximum time in seconds a read waits for a response. Defaults to 2.
+
+    Returns:
+        serial.Serial: The initialized serial port object.
+    """
+    return serial.Serial(port=device, baudrate=baudrate, bytesize=serial.EIGHTBITS,
+                         parity=serial.PARITY_NONE, stopbits=serial.STOPBITS_ONE, timeout=timeout)
+
+def wait_for_response(serial_port, timeout=2):
+    """
+    Wait until the serial port has data to read.
+
+    Sleeps in the kernel with select() on the port's file descriptor, so it
+    wakes up as soon as a byte arrives. Windows cannot select() on a serial
+    port; there in_waiting is polled every 10 ms until the timeout.
+
+    Args:
+        serial_port (serial.Serial): The initialized serial port object.
+        timeout (float, optional): The maximum wait time in seconds. Defaults to 2.
+
+    Returns:
+        bool: True if data is available, False otherwise.
+    """
+    if os.name == 'nt':
+        deadline = time.monotonic() + timeout
+        while not serial_port.in_waiting:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(remaining, 0.01))
+        return True
+    ready, _, _ = select.select([serial_port.fileno()], [], [], timeout)
+    return bool(ready)
+
+def read_frame(serial_port, max_length=256, gap=0.05):
+    """
+    Read a response of unknown length from the Modbus device.
+
+    Blocks until the first byte arrives or the port timeout expires, then keeps
+    reading until no new bytes arrive for `gap` seconds.
+
+    Args:
+        serial_port (serial.Serial): The initialized serial port object.
+        max_length (int, optional): The maximum response length. Defaults to 256.
+        gap (float, optional): The silence in seconds that ends the frame. Defaults to 0.05.
+
+    Returns:
+        bytes: The received data, empty if nothing arrived before the timeout.
+    """
+    response = serial_port.read(1)
+    while response and len(response) < max_length and wait_for_response(serial_port, gap):
+        response += serial_port.read(min(serial_port.in_waiting or 1, max_length - len(response)))
+    return response
+
+def padding_length(data):
+    """
+    Count the 0xFF padding bytes some devices send in front of a frame.
+
+    Args:
+        data (bytes): The received data.
+
+    Returns:
+        int: The index of the first byte that is not 0xFF.
+    """
+    start = 0
+    while start < len(data) and data[start] == 0xFF:
+        start += 1
+    return start
+
+def read_response(serial_port, header_length, frame_length):
+    """
+    Read exactly one response frame, using its header to find its length.
+
+    Leading 0xFF padding is skipped while reading the header and is kept in
+    the returned bytes.
+
+    Args:
+        serial_port (serial.Serial): The initialized serial port object.
+        header_length (int): The number of bytes needed to determine the frame length.
+        frame_length (callable): Returns the full frame length (CRC included) for a header.
+
+    Returns:
+        bytes: The received data, shorter than the frame if the port timed out.
+    """
+    response = serial_port.read(header_length)
+    while True:
+        start = padding_length(response)
+        missing = start + header_length - len(response)
+        if missing <= 0:
+            break
+        chunk = serial_port.read(missing)
+        if not chunk:
+            return response
+        response += chunk
+    missing = start + frame_length(response[start:start + header_length]) - len(response)
+    if missing > 0:
+        response += serial_port.read(missing)
+    return response
+
+def register_reply_length(header):
+    """
+    Get the length of a register read or write reply from its 9-byte header.
+
+    Args:
+        header (bytes): FD 46 09, the serial number, the function code and the next byte.
+
+    Returns:
+        int: The frame length, CRC included.
+    """
+    function = header[7]
+    # Exception replies carry a single error code after the function code
+    if function & 0x80:
+        return 11
+    # Write replies echo the start register and the register count or value
+    if function in (0x05, 0x06, 0x0F, 0x10):
+        return 8 + 4 + 2
+    return 9 + header[8] + 2
+
+def auto_int(value):
+    """
+    Automatically convert a string to an integer, supporting both decimal and hex formats.
+
+    Args:
+        value (str): The string representation of the number.
+
+    Returns:
+        int: The integer value.
+    """
+    return int(value, 0)
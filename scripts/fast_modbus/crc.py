@@ -0,0 +1,201 @@
+import functools
+import struct
+import sys
+
+_CRC_SUFFIX = struct.Struct('<H')
+
+def _crc_table_entry(byte):
+    """
+    Run the bit-serial CRC16 loop for a single byte value.
+
+    Args:
+        byte (int): The byte value (0-255).
+
+    Returns:
+        int: The CRC16 contribution of the byte.
+    """
+    crc = byte
+    for _ in range(8):
+        crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+    return crc
+
+_MODBUS_CRC_TABLE = tuple(_crc_table_entry(byte) for byte in range(256))
+
+def calculate_crc_table(data, _t=_MODBUS_CRC_TABLE):
+    """
+    Calculate the CRC16 checksum for Modbus data using a byte-wise lookup table.
+
+    Args:
+        data (bytes-like): The data to calculate the CRC for.
+
+    Returns:
+        int: The calculated CRC16 checksum.
+    """
+    crc = 0xFFFF
+    for byte in data:
+        crc = (crc >> 8) ^ _t[(crc ^ byte) & 0xFF]
+    return crc
+
+_MODBUS_CRC_TABLE_HIGH = tuple((crc >> 8) ^ _MODBUS_CRC_TABLE[crc & 0xFF] for crc in _MODBUS_CRC_TABLE)
+
+def calculate_crc_wide(data, _t=_MODBUS_CRC_TABLE, _th=_MODBUS_CRC_TABLE_HIGH):
+    """
+    Calculate the CRC16 checksum for Modbus data two bytes at a time.
+
+    Each step folds a little-endian 16-bit word into the CRC with two table
+    lookups, halving the loop iterations of calculate_crc_table. Only pays off
+    on longer buffers, and only on little-endian hosts.
+
+    Args:
+        data (bytes-like): The data to calculate the CRC for.
+
+    Returns:
+        int: The calculated CRC16 checksum.
+    """
+    view = memoryview(data)
+    even = len(view) & ~1
+    crc = 0xFFFF
+    for word in view[:even].cast('H'):
+        crc ^= word
+        crc = _th[crc & 0xFF] ^ _t[crc >> 8]
+    if even != len(view):
+        crc = (crc >> 8) ^ _t[(crc ^ view[even]) & 0xFF]
+    return crc
+
+WIDE_CRC_THRESHOLD = 64
+
+def calculate_crc_python(data):
+    """
+    Calculate the CRC16 checksum for Modbus data in pure Python.
+
+    Short frames go through the byte-wise table, long ones through the
+    two-byte fold.
+
+    Args:
+        data (bytes-like): The data to calculate the CRC for.
+
+    Returns:
+        int: The calculated CRC16 checksum.
+    """
+    if len(data) >= WIDE_CRC_THRESHOLD and sys.byteorder == 'little':
+        return calculate_crc_wide(data)
+    return calculate_crc_table(data)
+
+def _crc_nibble_entry(nibble):
+    """
+    Run the bit-serial CRC16 loop for a single 4-bit value.
+
+    Args:
+        nibble (int): The nibble value (0-15).
+
+    Returns:
+        int: The CRC16 contribution of the nibble.
+    """
+    crc = nibble
+    for _ in range(4):
+        crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+    return crc
+
+_MODBUS_CRC_TABLE_SMALL = tuple(_crc_nibble_entry(nibble) for nibble in range(16))
+
+def calculate_crc_small(data, _t=_MODBUS_CRC_TABLE_SMALL):
+    """
+    Calculate the CRC16 checksum for Modbus data using a 16-entry nibble table.
+
+    Slower than calculate_crc_table, but the table is 32 times smaller.
+
+    Args:
+        data (bytes-like): The data to calculate the CRC for.
+
+    Returns:
+        int: The calculated CRC16 checksum.
+    """
+    crc = 0xFFFF
+    for byte in data:
+        crc = (crc >> 4) ^ _t[(crc ^ byte) & 0x0F]
+        crc = (crc >> 4) ^ _t[(crc ^ (byte >> 4)) & 0x0F]
+    return crc
+
+def load_numba_crc():
+    """
+    Compile the table-driven CRC16 loop with Numba.
+
+    The compiled loop is cached next to this module, so only the first run
+    pays the JIT cost.
+
+    Returns:
+        callable: A CRC16 function accepting bytes-like data, or None if
+        Numba is not installed.
+    """
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        return None
+
+    table = np.array(_MODBUS_CRC_TABLE, np.uint16)
+
+    @njit(cache=True, boundscheck=False)
+    def crc_loop(data, table):
+        crc = 0xFFFF
+        for i in range(data.size):
+            crc = (crc >> 8) ^ table[(crc ^ data[i]) & 0xFF]
+        return crc
+
+    def calculate_crc_numba(data):
+        return crc_loop(np.frombuffer(data, np.uint8), table)
+
+    return calculate_crc_numba
+
+try:
+    from fastcrc.crc16 import modbus as calculate_crc
+except ImportError:
+    try:
+        import crcmod.predefined
+        calculate_crc = crcmod.predefined.mkPredefinedCrcFun('modbus')
+    except ImportError:
+        calculate_crc = calculate_crc_python
+
+@functools.lru_cache(maxsize=256)
+def frame_command(command):
+    """
+    Append the CRC16 checksum to a command.
+
+    Polling tools send the same few commands over and over, so results are
+    memoized and a repeated command skips the CRC calculation entirely.
+
+    Args:
+        command (bytes): The command to frame.
+
+    Returns:
+        bytes: The command followed by its little-endian CRC16.
+    """
+    return command + _CRC_SUFFIX.pack(calculate_crc(command))
+
+def use_small_table():
+    """
+    Make calculate_crc use the 16-entry nibble table instead of the default backend.
+    """
+    global calculate_crc
+    calculate_crc = calculate_crc_small
+    frame_command.cache_clear()
+
+def use_numba():
+    """
+    Make calculate_crc use the Numba-compiled loop if no native library is in use.
+
+    Opt-in, because importing and warming up Numba costs about half a second,
+    which only long-running tools win back.
+
+    Returns:
+        bool: True if a compiled backend is in use, False if Numba is not installed.
+    """
+    global calculate_crc
+    if calculate_crc is not calculate_crc_python:
+        return True
+    calculate_crc_numba = load_numba_crc()
+    if calculate_crc_numba is None:
+        return False
+    calculate_crc = calculate_crc_numba
+    frame_command.cache_clear()
+    return True
@@ -0,0 +1,147 @@
+import logging
+import struct
+
+from . import crc
+from .core import Lazy, auto_int, check_crc, format_bytes, init_serial, read_frame, send_command, setup_logging
+
+log = logging.getLogger(__name__)
+
+_EVENTS_REQ = struct.Struct('>BBBBBBB')
+_EVENT_HDR = struct.Struct('>HHH')
+
+def build_events_request(min_slave_id, max_data_length, slave_id, flag):
+    """
+    Build an event request command, without its CRC.
+
+    Args:
+        min_slave_id (int): The minimum slave ID from which to start responding.
+        max_data_length (int): The maximum length of the event data field.
+        slave_id (int): The slave ID of the device from which the previous packet was received.
+        flag (int): The flag confirming the previous packet received.
+
+    Returns:
+        bytes: The command FD 46 10 <min_slave_id> <max_data_length> <slave_id> <flag>.
+    """
+    return _EVENTS_REQ.pack(0xFD, 0x46, 0x10, min_slave_id, max_data_length, slave_id, flag)
+
+def check_event_response(response, prefix=''):
+    """
+    Check the header and CRC of an event response, printing what is wrong with it.
+
+    Args:
+        response (bytes): The response data with leading 0xFF bytes stripped.
+        prefix (str, optional): Text printed in front of error lines, e.g. the port. Defaults to ''.
+
+    Returns:
+        bool: True if the response is valid, False otherwise.
+    """
+    if len(response) < 5 or response[1] != 0x46:
+        print(f"{prefix}[error] Unexpected response.")
+        return False
+    if not check_crc(response):
+        print(f"{prefix}[error] Invalid CRC in response.")
+        return False
+    return True
+
+def parse_event_response(response, prefix='', report_empty=True):
+    """
+    Parse the event response from the Modbus device and print it in a structured format.
+
+    Args:
+        response (bytes): The response data with leading 0xFF bytes stripped.
+        prefix (str, optional): Text printed in front of each line, e.g. the port. Defaults to ''.
+        report_empty (bool, optional): Whether to print a line for a response without events. Defaults to True.
+
+    Returns:
+        tuple: The (slave_id, flag) pair confirming this packet, or None if it carried no events.
+    """
+    # Handle the case when there are no events
+    if len(response) < 7:
+        if report_empty:
+            print(f"{prefix}NO EVENTS")
+        return None
+
+    if len(response) < 12:
+        print(f"{prefix}[error] Response too short to be valid")
+        return None
+
+    # Parse the response structure
+    device_id = response[0]
+    command = response[1]
+    subcommand = response[2]
+    flag = response[3]
+    event_count = response[4]
+    # event data length, event type, event payload
+    event_data_len, event_type, event_payload = _EVENT_HDR.unpack_from(response, 5)
+
+    frame_len = len(response)
+
+    # Output similar to reference utility
+    print(f"{prefix}device: {device_id:3} - events: {event_count:3}   flag: {flag:1}   event data len: {event_data_len:03}   frame len: {frame_len:03}")
+    print(f"{prefix}Event type: {event_type:3}   id: {event_payload:5} [0000]   payload: {event_payload:10}   device {device_id}")
+    return device_id, flag
+
+def request_events(serial_port, min_slave_id, max_data_length, slave_id, flag):
+    """
+    Request events from the Modbus device using the "Fast Modbus" protocol with specified parameters.
+
+    Args:
+        serial_port (serial.Serial): The initialized serial port object.
+        min_slave_id (int): The minimum slave ID from which to start responding.
+        max_data_length (int): The maximum length of the event data field.
+        slave_id (int): The slave ID of the device from which the previous packet was received.
+        flag (int): The flag confirming the previous packet received.
+
+    Returns:
+        bytes: The received events data, or None if an error occurred.
+    """
+    send_command(serial_port, build_events_request(min_slave_id, max_data_length, slave_id, flag))
+
+    response = read_frame(serial_port)
+    if not response:
+        return None
+    log.debug("RCV (raw): %s", Lazy(format_bytes, response))
+
+    # Strip leading 0xFF bytes from the response
+    response = response.lstrip(b'\xFF')
+
+    log.debug("RCV (filtered): %s", Lazy(format_bytes, response))
+
+    if not check_event_response(response):
+        return None
+    return response
+
+def main():
+    """
+    Main function to parse arguments and request events from the Modbus devices as per the protocol.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description="Fast Modbus Event Reader with full event request support")
+    parser.add_argument('-d', '--device', required=True, help="TTY serial device (e.g., /dev/ttyUSB0)")
+    parser.add_argument('-b', '--baud', type=int, default=9600, help="Baudrate, default 9600")
+    parser.add_argument('--min_slave_id', type=auto_int, default=1, help="Minimum slave ID to start responding. Default is 1.")
+    parser.add_argument('--max_data_length', type=auto_int, default=100, help="Maximum length of event data (default 100 bytes)")
+    parser.add_argument('--slave_id', type=auto_int, default=0x00, help="The slave ID from which the last event packet was received.")
+    parser.add_argument('--flag', type=auto_int, default=0x00, help="Flag confirming the previous packet received.")
+    parser.add_argument('--debug', action='store_true', help="Enable debug output")
+    parser.add_argument('--small-table', action='store_true', help="Use the 16-entry CRC table (smaller, slower)")
+    args = parser.parse_args()
+
+    setup_logging(args.debug)
+
+    if args.small_table:
+        crc.use_small_table()
+
+    serial_port = init_serial(args.device, args.baud)
+
+    # Request events from the Modbus device with all required parameters
+    result = request_events(serial_port, args.min_slave_id, args.max_data_length, args.slave_id, args.flag)
+    if result:
+        parse_event_response(result)
+    else:
+        print("Failed to read events.")
+
+    serial_port.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import logging
+import selectors
+import time
+
+from . import crc
+from .core import Lazy, auto_int, format_bytes, init_serial, send_command, setup_logging
+from .events import build_events_request, check_event_response, parse_event_response
+
+log = logging.getLogger(__name__)
+
+def request_events(state, min_slave_id, max_data_length):
+    """
+    Send an event request on one port, confirming the last packet received there.
+
+    Args:
+        state (dict): The polling state of the port.
+        min_slave_id (int): The minimum slave ID from which to start responding.
+        max_data_length (int): The maximum length of the event data field.
+    """
+    request_command = build_events_request(min_slave_id, max_data_length, state["slave_id"], state["flag"])
+    state["buffer"].clear()
+    send_command(state["port"], request_command, f"{state['port'].port} ")
+
+def finish_response(state):
+    """
+    Handle the bytes collected on one port once its response is complete or timed out.
+
+    Args:
+        state (dict): The polling state of the port.
+    """
+    device = state["port"].port
+    log.debug("%s RCV (raw): %s", device, Lazy(format_bytes, state["buffer"]))
+
+    response = bytes(state["buffer"]).lstrip(b'\xFF')
+    if not response or not check_event_response(response, f"{device}: "):
+        return
+
+    confirmation = parse_event_response(response, f"{device}: ", report_empty=False)
+    if confirmation:
+        state["slave_id"], state["flag"] = confirmation
+
+def poll_events(serial_ports, min_slave_id, max_data_length, interval=0.1, timeout=2, gap=0.05):
+    """
+    Poll events on several serial ports at once from a single thread.
+
+    All ports are waited on with one selector, so a slow bus never delays
+    the others. POSIX only: Windows cannot select on serial ports.
+
+    Args:
+        serial_ports (list of serial.Serial): The initialized serial port objects.
+        min_slave_id (int): The minimum slave ID from which to start responding.
+        max_data_length (int): The maximum length of the event data field.
+        interval (float, optional): The pause in seconds between requests on a port. Defaults to 0.1.
+        timeout (float, optional): The maximum wait in seconds for a response. Defaults to 2.
+        gap (float, optional): The silence in seconds that ends a response. Defaults to 0.05.
+    """
+    selector = selectors.DefaultSelector()
+    states = []
+    for serial_port in serial_ports:
+        state = {"port": serial_port, "buffer": bytearray(), "slave_id": 0, "flag": 0,
+                 "waiting": False, "deadline": time.monotonic()}
+        selector.register(serial_port.fileno(), selectors.EVENT_READ, state)
+        states.append(state)
+
+    try:
+        while True:
+            now = time.monotonic()
+            for state in states:
+                if now < state["deadline"]:
+                    continue
+                if state["waiting"]:
+                    finish_response(state)
+                    state["waiting"] = False
+                    state["deadline"] = now + interval
+                else:
+                    request_events(state, min_slave_id, max_data_length)
+                    state["waiting"] = True
+                    state["deadline"] = now + timeout
+
+            wait = max(0, min(state["deadline"] for state in states) - time.monotonic())
+            for key, _ in selector.select(wait):
+                state = key.data
+                serial_port = state["port"]
+                state["buffer"] += serial_port.read(serial_port.in_waiting or 1)
+                if state["waiting"]:
+                    state["deadline"] = time.monotonic() + gap
+    finally:
+        selector.close()
+
+def main():
+    """
+    Main function to parse arguments and poll events on one or more serial ports.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description="Fast Modbus Event Poller for multiple serial ports")
+    parser.add_argument('-d', '--device', nargs='+', required=True, help="TTY serial devices (e.g., /dev/ttyUSB0 /dev/ttyUSB1)")
+    parser.add_argument('-b', '--baud', type=int, default=9600, help="Baudrate, default 9600")
+    parser.add_argument('--min_slave_id', type=auto_int, default=1, help="Minimum slave ID to start responding. Default is 1.")
+    parser.add_argument('--max_data_length', type=auto_int, default=100, help="Maximum length of event data (default 100 bytes)")
+    parser.add_argument('--interval', type=float, default=0.1, help="Pause in seconds between requests on a port (default 0.1)")
+    parser.add_argument('--debug', action='store_true', help="Enable debug output")
+    crc_group = parser.add_mutually_exclusive_group()
+    crc_group.add_argument('--small-table', action='store_true', help="Use the 16-entry CRC table (smaller, slower)")
+    crc_group.add_argument('--numba', action='store_true', help="Compile the CRC with Numba if no native CRC library is installed")
+    args = parser.parse_args()
+
+    setup_logging(args.debug)
+
+    if args.small_table:
+        crc.use_small_table()
+    elif args.numba and not crc.use_numba():
+        print("[warning] Numba is not installed, using the pure Python CRC.")
+
+    serial_ports = [init_serial(device, args.baud, timeout=0) for device in args.device]
+    try:
+        poll_events(serial_ports, args.min_slave_id, args.max_data_length, args.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for serial_port in serial_ports:
+            serial_port.close()
+
+if __name__ == "__main__":
+    main()